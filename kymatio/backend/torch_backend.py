@@ -156,6 +156,7 @@ def cdgmm(A, B, inplace=False):
             A is a complex tensor of size (B, C, M, N, 2).
         B : tensor
             B is a complex tensor of size (M, N, 2) or real tensor of (M, N, 1).
+            A real B may have a lower floating-point precision than A.
         inplace : boolean, optional
             If set to True, all the operations are performed in place.
 
@@ -168,8 +169,9 @@ def cdgmm(A, B, inplace=False):
 
         TypeError
             In the event that A is not complex, or B does not have a final
-            dimension of 1 or 2, or A and B are not of the same dtype, or if
-            A and B are not on the same device.
+            dimension of 1 or 2, or A and B are not of the same dtype (unless
+            B is real and of lower precision), or if A and B are not on the
+            same device.
 
         Returns
         -------
@@ -190,7 +192,12 @@ def cdgmm(A, B, inplace=False):
         raise RuntimeError('The filters are not compatible for multiplication.')
 
     if A.dtype is not B.dtype:
-        raise TypeError('Input and filter must be of the same dtype.')
+        # Real filters may be stored in a lower precision than the input
+        # (e.g., bfloat16) to save memory, in which case they are upcast on
+        # the fly during the multiplication.
+        if not (_is_real(B) and B.is_floating_point()
+                and torch.promote_types(A.dtype, B.dtype) == A.dtype):
+            raise TypeError('Input and filter must be of the same dtype.')
 
     if B.device.type == 'cuda':
         if A.device.type == 'cuda':
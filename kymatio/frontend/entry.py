@@ -4,27 +4,31 @@ import importlib
 
 
 class ScatteringEntry(object):
-    def __init__(self, *args, **kwargs):
-        self.name = kwargs['name']
-        self.class_name = kwargs['class_name']
-        kwargs.pop('name')
-        kwargs.pop('class_name')
-
-        frontend_suffixes = {'torch' : 'Torch',
-                             'numpy' : 'NumPy',
-                             'tensorflow' : 'TensorFlow',
-                             'keras': 'Keras',
-                             'sklearn': 'Transformer'}
-
+    """Dispatches the construction of a scattering object to a frontend.
+
+    Subclasses set `name` (used in messages) and `class_name` (the package
+    of the transform, e.g. `'scattering1d'`). Instantiating a subclass
+    returns an instance of the frontend-specific class directly, so the
+    entry class itself is never initialized.
+    """
+    name = None
+    class_name = None
+
+    frontend_suffixes = {'torch' : 'Torch',
+                         'numpy' : 'NumPy',
+                         'tensorflow' : 'TensorFlow',
+                         'keras': 'Keras',
+                         'sklearn': 'Transformer'}
+
+    def __new__(cls, *args, **kwargs):
         if 'frontend' not in kwargs:
             warnings.warn("Torch frontend is currently the default, but NumPy will become the default in the next"
                           " version.", DeprecationWarning)
             frontend = 'torch'
         else:
-            frontend = kwargs['frontend'].lower()
-            kwargs.pop('frontend')
+            frontend = kwargs.pop('frontend').lower()
 
-        frontends = list(frontend_suffixes.keys())
+        frontends = list(cls.frontend_suffixes.keys())
 
         if frontend not in frontends:
             raise RuntimeError('The frontend \'%s\" is not valid. Must be '
@@ -33,25 +37,25 @@ class ScatteringEntry(object):
                                 frontends[-1]))
 
         try:
-            module = importlib.import_module('kymatio.' + self.class_name + '.frontend.' + frontend + '_frontend')
+            module = importlib.import_module('kymatio.' + cls.class_name + '.frontend.' + frontend + '_frontend')
+        except ImportError as e:
+            raise ImportError('The frontend \'' + frontend + '\' could not be correctly imported: ' +
+                              str(e)) from e
 
-            # Create frontend-specific class name by inserting frontend name
-            # after `Scattering`.
-            frontend = frontend_suffixes[frontend]
+        # Create frontend-specific class name by inserting frontend name
+        # after `Scattering`.
+        class_name = cls.__name__
 
-            class_name = self.__class__.__name__
+        base_name = class_name[:-len('Entry*D')]
+        dim_suffix = class_name[-len('*D'):]
 
-            base_name = class_name[:-len('Entry*D')]
-            dim_suffix = class_name[-len('*D'):]
+        class_name = base_name + cls.frontend_suffixes[frontend] + dim_suffix
 
-            class_name = base_name + frontend + dim_suffix
+        frontend_class = getattr(module, class_name)
 
-            self.__class__ = getattr(module, class_name)
-            self.__init__(*args, **kwargs)
-        except Exception as e:
-            raise e from RuntimeError('\nThe frontend \'' + frontend + '\' could not be correctly imported.')
+        logging.info('The ' + cls.name + ' frontend ' + frontend + ' was imported.')
 
-        logging.info('The ' + self.name + ' frontend ' + frontend + ' was imported.')
+        return frontend_class(*args, **kwargs)
 
 
 __all__ = ['ScatteringEntry']
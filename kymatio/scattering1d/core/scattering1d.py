@@ -22,8 +22,9 @@ def scattering1d(x, pad, unpad, backend, J, psi1, psi2, phi, pad_left=0,
         dilation factors: psi1[(j, n)][j2] corresponds to a support of size
         :math:`2^{J_\\text{max} - j_2}`, where :math:`J_\\text{max}` has been
         defined a priori (`J_max = size` of the padding support of the input)
-        * psi1[(j, n)] only has real values;
-        the tensors are complex so that broadcasting applies
+        * psi1[(j, n)] only has real values, so the filters are stored as
+        real tensors (with a last axis of size 1 for the torch backend) and
+        are broadcast against the complex input when multiplying
     psi2 : dictionary
         a dictionary of filters, with keys (j2, n2). Same remarks as for psi1
     phi : dictionary
@@ -23,6 +23,18 @@ class ScatteringBase1D(ScatteringBase):
         self.out_type = out_type
         self.backend = backend
 
+    @property
+    def max_order(self):
+        return self._max_order
+
+    @max_order.setter
+    def max_order(self, max_order):
+        self._max_order = max_order
+        # The number of coefficients per order only depends on J, Q and
+        # max_order, so it is computed here once instead of at every call.
+        self._size_scattering = precompute_size_scattering(
+            self.J, self.Q, max_order=max_order, detail=True)
+
     def build(self):
         """Set up padding and filters
 
@@ -5,7 +5,6 @@ import warnings
 
 from ...frontend.tensorflow_frontend import ScatteringTensorFlow
 from ..core.scattering1d import scattering1d
-from ..utils import precompute_size_scattering
 from .base_frontend import ScatteringBase1D
 
 
@@ -49,11 +48,7 @@ class ScatteringTensorFlow1D(ScatteringTensorFlow, ScatteringBase1D):
 
         # get the arguments before calling the scattering
         # treat the arguments
-        if self.vectorize:
-            size_scattering = precompute_size_scattering(
-                self.J, self.Q, max_order=self.max_order, detail=True)
-        else:
-            size_scattering = 0
+        size_scattering = self._size_scattering if self.vectorize else 0
 
         S = scattering1d(x, self.backend.pad, self.backend.unpad, self.backend, self.J, self.psi1_f, self.psi2_f,
                          self.phi_f, max_order=self.max_order, average=self.average, pad_left=self.pad_left,
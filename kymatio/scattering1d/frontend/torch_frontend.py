@@ -1,12 +1,12 @@
 # Authors: Mathieu Andreux, Joakim Anden, Edouard Oyallon
 # Scientific Ancestry: Joakim Anden, Mathieu Andreux, Vincent Lostanlen
 
+import numpy as np
 import torch
 import warnings
 
 from ...frontend.torch_frontend import ScatteringTorch
 from ..core.scattering1d import scattering1d
-from ..utils import precompute_size_scattering
 from .base_frontend import ScatteringBase1D
 
 
@@ -21,57 +21,103 @@ class ScatteringTorch1D(ScatteringTorch, ScatteringBase1D):
         ScatteringBase1D.create_filters(self)
         self.register_filters()
 
+    def _iter_filter_items(self):
+        """Iterates over the filters in a fixed order (phi, psi1, psi2),
+        yielding pairs (index of the filter dictionary in that order,
+        resolution)."""
+        for j, filt in enumerate([self.phi_f] + self.psi1_f + self.psi2_f):
+            for k in filt.keys():
+                if type(k) != str:
+                    yield j, k
+
     def register_filters(self):
         """ This function run the filterbank function that
         will create the filters as numpy array, and then, it
-        saves those arrays as module's buffers."""
-        n = 0
-        # prepare for pytorch
-        for k in self.phi_f.keys():
-            if type(k) != str:
-                # view(-1, 1).repeat(1, 2) because real numbers!
-                self.phi_f[k] = torch.from_numpy(
-                    self.phi_f[k]).float().view(-1, 1)
-                self.register_buffer('tensor' + str(n), self.phi_f[k])
-                n += 1
-        for psi_f in self.psi1_f:
-            for sub_k in psi_f.keys():
-                if type(sub_k) != str:
-                    # view(-1, 1).repeat(1, 2) because real numbers!
-                    psi_f[sub_k] = torch.from_numpy(
-                        psi_f[sub_k]).float().view(-1, 1)
-                    self.register_buffer('tensor' + str(n), psi_f[sub_k])
-                    n += 1
-        for psi_f in self.psi2_f:
-            for sub_k in psi_f.keys():
-                if type(sub_k) != str:
-                    # view(-1, 1).repeat(1, 2) because real numbers!
-                    psi_f[sub_k] = torch.from_numpy(
-                        psi_f[sub_k]).float().view(-1, 1)
-                    self.register_buffer('tensor' + str(n), psi_f[sub_k])
-                    n += 1
+        saves those arrays as module's buffers. All the filters at a given
+        resolution are stacked into a single buffer `filters_res{k}` of size
+        `(n_filters, 2**(J_pad - k), 1)`. Since the filters are real, these
+        buffers may be cast to a lower precision (e.g., using
+        `to(torch.bfloat16)`) while the transform itself is computed in the
+        precision of the input."""
+        # group the filters by resolution and record once, for each filter,
+        # its position (dictionary, resolution, index in the stacked buffer)
+        filters = {}
+        self._filter_refs = []
+        all_filters = [self.phi_f] + self.psi1_f + self.psi2_f
+        for j, k in self._iter_filter_items():
+            filters_k = filters.setdefault(k, [])
+            self._filter_refs.append((j, k, len(filters_k)))
+            filters_k.append(all_filters[j][k])
+
+        # the first-order filters are only built at resolution 0, where they
+        # are contiguous and come right after the low-pass filter
+        self._psi1_f_slice = slice(1, 1 + len(self.psi1_f))
+
+        # prepare for pytorch, the last axis of size 1 because real numbers!
+        # The float32 stack is filled in a single pass and shared with torch.
+        for k, filters_k in filters.items():
+            stacked = np.empty((len(filters_k),) + filters_k[0].shape + (1,),
+                               dtype=np.float32)
+            np.stack(filters_k, out=stacked[..., 0])
+            self.register_buffer('filters_res' + str(k),
+                                 torch.from_numpy(stacked))
+
+        self.load_filters()
+
+    def psi1_f_res(self):
+        """Get all the first-order filters
+
+        The first-order filters are only computed at resolution `0`.
+
+        Returns
+        -------
+        psi1_f : tensor
+            A view of size `(n_filters, 2**J_pad, 1)` into the buffer
+            `filters_res0`, where the filters are in the same order as in
+            `psi1_f`. This allows to apply all of them at once by
+            broadcasting.
+        """
+        return self.filters_res0[self._psi1_f_slice]
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        # State dictionaries saved before the filters were stacked by
+        # resolution hold one buffer `tensor{n}` per filter, numbered in the
+        # order of `_filter_refs`. Restack them into `filters_res{k}`.
+        if prefix + 'tensor0' in state_dict:
+            filters = {}
+            for n_legacy, (j, k, n) in enumerate(self._filter_refs):
+                key = prefix + 'tensor' + str(n_legacy)
+                if key in state_dict:
+                    filters.setdefault(k, []).append(state_dict.pop(key))
+            for k, filters_k in filters.items():
+                state_dict[prefix + 'filters_res' + str(k)] = torch.stack(filters_k)
+        super(ScatteringTorch1D, self)._load_from_state_dict(
+            state_dict, prefix, *args, **kwargs)
 
     def load_filters(self):
-        """This function loads filters from the module's buffer """
-        buffer_dict = dict(self.named_buffers())
-        n = 0
-
-        for k in self.phi_f.keys():
-            if type(k) != str:
-                self.phi_f[k] = buffer_dict['tensor' + str(n)]
-                n += 1
-
-        for psi_f in self.psi1_f:
-            for sub_k in psi_f.keys():
-                if type(sub_k) != str:
-                    psi_f[sub_k] = buffer_dict['tensor' + str(n)]
-                    n += 1
-
-        for psi_f in self.psi2_f:
-            for sub_k in psi_f.keys():
-                if type(sub_k) != str:
-                    psi_f[sub_k] = buffer_dict['tensor' + str(n)]
-                    n += 1
+        """This function loads filters from the module's buffer. Each filter
+        is a view into the buffer of its resolution. The filter dictionaries
+        are rebuilt rather than updated, so that copies of the module (e.g.,
+        `nn.DataParallel` replicas) do not overwrite each other's filters."""
+        self._loaded_buffers = {k: self._buffers['filters_res' + str(k)]
+                                for k in set(k for _, k, _ in self._filter_refs)}
+
+        all_filters = [dict(filt) for filt in
+                       [self.phi_f] + self.psi1_f + self.psi2_f]
+        for j, k, n in self._filter_refs:
+            all_filters[j][k] = self._loaded_buffers[k][n]
+
+        n_psi1 = len(self.psi1_f)
+        self.phi_f = all_filters[0]
+        self.psi1_f = all_filters[1:1 + n_psi1]
+        self.psi2_f = all_filters[1 + n_psi1:]
+
+    def _filters_synced(self):
+        """Checks that the filter dictionaries are views into the current
+        buffers, which may have been replaced since the last call (e.g., by
+        `to`, `load_state_dict(..., assign=True)` or `functional_call`)."""
+        return all(self._buffers['filters_res' + str(k)] is buffer
+                   for k, buffer in self._loaded_buffers.items())
 
     def scattering(self, x):
         # basic checking, should be improved
@@ -100,15 +146,12 @@ class ScatteringTorch1D(ScatteringTorch, ScatteringBase1D):
 
         x = x.reshape((-1, 1) + signal_shape)
 
-        self.load_filters()
+        if not self._filters_synced():
+            self.load_filters()
 
         # get the arguments before calling the scattering
         # treat the arguments
-        if self.vectorize:
-            size_scattering = precompute_size_scattering(
-                self.J, self.Q, max_order=self.max_order, detail=True)
-        else:
-            size_scattering = 0
+        size_scattering = self._size_scattering if self.vectorize else 0
 
 
         S = scattering1d(x, self.backend.pad, self.backend.unpad, self.backend, self.J, self.psi1_f, self.psi2_f, self.phi_f,\
@@ -126,13 +169,16 @@ class ScatteringTorch1D(ScatteringTorch, ScatteringBase1D):
 
             S = S.reshape(new_shape)
         elif self.out_type == 'array' and not self.vectorize:
-            for k, v in S.items():
-                # NOTE: Have to get the shape for each one since we may have
-                # average == False.
-                scattering_shape = v.shape[-2:]
-                new_shape = batch_shape + scattering_shape
-
-                S[k] = v.reshape(new_shape)
+            # NOTE: With a single batch dimension, the coefficients already
+            # have the shape batch_shape + (1, T1), so there is nothing to do.
+            if len(batch_shape) != 1:
+                for k, v in S.items():
+                    # NOTE: Have to get the shape for each one since we may have
+                    # average == False.
+                    scattering_shape = v.shape[-2:]
+                    new_shape = batch_shape + scattering_shape
+
+                    S[k] = v.reshape(new_shape)
         elif self.out_type == 'list':
             for x in S:
                 scattering_shape = x['coef'].shape[-1:]
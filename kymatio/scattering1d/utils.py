@@ -1,6 +1,7 @@
 import numpy as np
 import math
-from .filter_bank import scattering_filter_factory, calibrate_scattering_filters
+from .filter_bank import (calibrate_scattering_filters, compute_temporal_support,
+    gauss_1d)
 
 def compute_border_indices(J, i0, i1):
     """
@@ -82,8 +83,10 @@ def compute_minimum_support_to_pad(T, J, Q, criterion_amplitude=1e-3,
     Q : int
         number of wavelets per octave
     normalize : string, optional
-        normalization type for the wavelets.
-        Only `'l2'` or `'l1'` normalizations are supported.
+        normalization type for the wavelets. Only the support of the
+        low-pass filter is computed, which does not depend on the
+        normalization, so this parameter has no effect and is only kept for
+        backward compatibility.
         Defaults to `'l1'`
     criterion_amplitude: float `>0` and `<1`, optional
         Represents the numerical error which is allowed to be lost after
@@ -122,10 +125,13 @@ def compute_minimum_support_to_pad(T, J, Q, criterion_amplitude=1e-3,
         boundary error.
     """
     J_tentative = int(np.ceil(np.log2(T)))
-    _, _, _, t_max_phi = scattering_filter_factory(
-        J_tentative, J, Q, normalize=normalize, to_torch=False,
-        max_subsampling=0, criterion_amplitude=criterion_amplitude,
-        r_psi=r_psi, sigma0=sigma0, alpha=alpha, P_max=P_max, eps=eps)
+    # Only the support of the low-pass filter matters here, so there is no
+    # need to build the whole filter bank.
+    sigma_low, _, _, _, _, _, _ = calibrate_scattering_filters(
+        J, Q, r_psi=r_psi, sigma0=sigma0, alpha=alpha)
+    phi_f = gauss_1d(2**J_tentative, sigma_low, P_max=P_max, eps=eps)
+    t_max_phi = compute_temporal_support(
+        phi_f.reshape(1, -1), criterion_amplitude=criterion_amplitude)
     min_to_pad = 3 * t_max_phi
     return min_to_pad
 
@@ -164,11 +170,11 @@ def precompute_size_scattering(J, Q, max_order=2, detail=False):
 
     size_order0 = 1
     size_order1 = len(xi1)
-    size_order2 = 0
-    for n1 in range(len(xi1)):
-        for n2 in range(len(xi2)):
-            if j2[n2] > j1[n1]:
-                size_order2 += 1
+    # j2 is non-decreasing, so the number of second-order filters with
+    # j2 > j1 is obtained for each j1 by a binary search.
+    j1, j2 = np.asarray(j1), np.asarray(j2)
+    size_order2 = int(len(j2) * len(j1)
+                      - np.searchsorted(j2, j1, side='right').sum())
     if detail:
         if max_order == 2:
             return size_order0, size_order1, size_order2
@@ -226,54 +232,40 @@ def compute_meta_scattering(J, Q, max_order=2):
     sigma_low, xi1s, sigma1s, j1s, xi2s, sigma2s, j2s = \
         calibrate_scattering_filters(J, Q)
 
+    xi1s, sigma1s, j1s = np.asarray(xi1s), np.asarray(sigma1s), np.asarray(j1s)
+    xi2s, sigma2s, j2s = np.asarray(xi2s), np.asarray(sigma2s), np.asarray(j2s)
+    n1s, n2s = np.arange(len(xi1s)), np.arange(len(xi2s))
+
+    # Second-order coefficients are only computed for j2 > j1. The indices
+    # are listed in the same order as the scattering, that is, by n1 first.
+    if max_order >= 2:
+        idx1, idx2 = np.nonzero(j2s[np.newaxis, :] > j1s[:, np.newaxis])
+    else:
+        idx1, idx2 = np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+    size_order1 = len(n1s)
+    size_order2 = len(idx1)
+    order1 = slice(1, 1 + size_order1)
+    order2 = slice(1 + size_order1, 1 + size_order1 + size_order2)
+
     meta = {}
 
-    meta['order'] = [[], [], []]
-    meta['xi'] = [[], [], []]
-    meta['sigma'] = [[], [], []]
-    meta['j'] = [[], [], []]
-    meta['n'] = [[], [], []]
-    meta['key'] = [[], [], []]
-
-    meta['order'][0].append(0)
-    meta['xi'][0].append(())
-    meta['sigma'][0].append(())
-    meta['j'][0].append(())
-    meta['n'][0].append(())
-    meta['key'][0].append(())
-
-    for (n1, (xi1, sigma1, j1)) in enumerate(zip(xi1s, sigma1s, j1s)):
-        meta['order'][1].append(1)
-        meta['xi'][1].append((xi1,))
-        meta['sigma'][1].append((sigma1,))
-        meta['j'][1].append((j1,))
-        meta['n'][1].append((n1,))
-        meta['key'][1].append((n1,))
-
-        if max_order < 2:
-            continue
-
-        for (n2, (xi2, sigma2, j2)) in enumerate(zip(xi2s, sigma2s, j2s)):
-            if j2 > j1:
-                meta['order'][2].append(2)
-                meta['xi'][2].append((xi1, xi2))
-                meta['sigma'][2].append((sigma1, sigma2))
-                meta['j'][2].append((j1, j2))
-                meta['n'][2].append((n1, n2))
-                meta['key'][2].append((n1, n2))
-
-    for field, value in meta.items():
-        meta[field] = value[0] + value[1] + value[2]
-
-    pad_fields = ['xi', 'sigma', 'j', 'n']
-    pad_len = max_order
-
-    for field in pad_fields:
-        meta[field] = [x + (math.nan,) * (pad_len - len(x)) for x in meta[field]]
-
-    array_fields = ['order', 'xi', 'sigma', 'j', 'n']
-
-    for field in array_fields:
-        meta[field] = np.array(meta[field])
+    meta['order'] = np.repeat([0, 1, 2], [1, size_order1, size_order2])
+
+    fields = {'xi': (xi1s, xi2s),
+              'sigma': (sigma1s, sigma2s),
+              'j': (j1s, j2s),
+              'n': (n1s, n2s)}
+
+    # Fields are padded with NaNs for orders below max_order.
+    for field, (value1, value2) in fields.items():
+        meta[field] = np.full((len(meta['order']), max_order), math.nan)
+        meta[field][order1, 0] = value1
+        if max_order >= 2:
+            meta[field][order2, 0] = value1[idx1]
+            meta[field][order2, 1] = value2[idx2]
+
+    meta['key'] = ([()] + [(n1,) for n1 in n1s.tolist()]
+                   + list(zip(idx1.tolist(), idx2.tolist())))
 
     return meta
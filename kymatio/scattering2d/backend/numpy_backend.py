@@ -1,6 +1,7 @@
 # Authors: Edouard Oyallon, Sergey Zagoruyko, Muawiz Chaudhary
 
 import numpy as np
+import scipy.fft
 from collections import namedtuple
 
 BACKEND_NAME = 'numpy'
@@ -19,18 +20,64 @@ class Pad(object):
             Parameters
             ----------
             pad_size : list of 4 integers
-                size of padding to apply.
+                size of padding to apply [top, bottom, left, right].
             input_size : list of 2 integers
-                size of the original signal
+                size of the original signal [height, width].
 
         """
         self.pad_size = pad_size
+        self.input_size = input_size
+
+        self.build()
+
+    def build(self):
+        """
+            Precomputes the size of the padded output as well as the slices
+            used to fill it. The input is copied in the center of the output
+            and the borders are filled with reflections of it (without
+            repeating the edge), first along the columns, then along the
+            rows, which takes care of the corners. Borders at least as large
+            as the input need several reflections, in which case the indices
+            of the padded output in the input are precomputed instead.
+
+        """
+        top, bottom, left, right = self.pad_size
+        M, N = self.input_size
+
+        self.output_size = (top + M + bottom, left + N + right)
+        self.center = (slice(top, top + M), slice(left, left + N))
+
+        # Slice copies can only reflect borders that are smaller than the
+        # input, otherwise we gather along each axis.
+        self.use_indices = max(top, bottom) >= M or max(left, right) >= N
+
+        self.row_indices = np.pad(np.arange(M), (top, bottom), mode='reflect')
+        self.col_indices = np.pad(np.arange(N), (left, right), mode='reflect')
+
+        def reflections(before, size, after):
+            end = before + size - 1
+            stop = end - 1 - after
+            return [(slice(0, before), slice(2 * before, before, -1)),
+                    (slice(end + 1, end + 1 + after),
+                     slice(end - 1, stop if stop >= 0 else None, -1))]
+
+        self.row_reflections = reflections(top, M, bottom)
+        self.col_reflections = reflections(left, N, right)
 
     def __call__(self, x):
-        paddings = ((0, 0),) * (x.ndim - 2)
-        paddings += ((self.pad_size[0], self.pad_size[1]), (self.pad_size[2], self.pad_size[3]))
+        if self.use_indices:
+            output = x.take(self.row_indices, axis=-2)
+            return output.take(self.col_indices, axis=-1)
+
+        output = np.empty(x.shape[:-2] + self.output_size, dtype=x.dtype)
+        output[(Ellipsis,) + self.center] = x
+
+        rows = self.center[0]
+        for dst, src in self.col_reflections:
+            output[..., rows, dst] = output[..., rows, src]
+        for dst, src in self.row_reflections:
+            output[..., dst, :] = output[..., src, :]
 
-        output = np.pad(x, paddings, mode='reflect')
         return output
 
 
@@ -73,9 +120,19 @@ class SubsampleFourier(object):
 
     """
     def __call__(self, x, k):
-        y = x.reshape(-1, k, x.shape[1] // k, k, x.shape[2] // k)
+        M, N = x.shape[-2] // k, x.shape[-1] // k
 
-        out = y.mean(axis=(1, 3))
+        # Periodize along the rows, then along the columns, by accumulating
+        # contiguous blocks into a single output buffer.
+        rows = x[..., :M, :].copy()
+        for i in range(1, k):
+            rows += x[..., i * M:(i + 1) * M, :]
+
+        out = rows[..., :N].copy()
+        for j in range(1, k):
+            out += rows[..., j * N:(j + 1) * N]
+
+        out /= k * k
 
         return out
 
@@ -84,14 +141,20 @@ def concatenate(arrays):
     return np.stack(arrays, axis=-3)
 
 
+def _promote(x):
+    # np.fft always computes in double precision, while scipy.fft keeps
+    # single precision; promote to keep the output dtype unchanged.
+    return x.astype(np.promote_types(x.dtype, np.float64), copy=False)
+
+
 backend = namedtuple('backend', ['name', 'cdgmm', 'modulus', 'subsample_fourier', 'fft', 'Pad', 'unpad', 'concatenate'])
 backend.name = 'numpy'
 backend.cdgmm = cdgmm
 backend.modulus = modulus
 backend.subsample_fourier = SubsampleFourier()
-backend.fft = FFT(lambda x:np.fft.fft2(x),
-                  lambda x:np.fft.ifft2(x),
-                  lambda x:np.real(np.fft.ifft2(x)),
+backend.fft = FFT(lambda x:scipy.fft.fft2(_promote(x), workers=-1),
+                  lambda x:scipy.fft.ifft2(_promote(x), workers=-1),
+                  lambda x:np.real(scipy.fft.ifft2(_promote(x), workers=-1)),
                   lambda x:None)
 backend.Pad = Pad
 backend.unpad = unpad
@@ -35,6 +35,11 @@ class ScatteringNumPy2D(ScatteringNumPy, ScatteringBase2D):
 
         input = input.reshape((-1,) + signal_shape)
 
+        # Without padding, the input goes straight into the first FFT, which
+        # runs fastest on a C-contiguous batch.
+        if self.pre_pad:
+            input = np.ascontiguousarray(input)
+
         S = scattering2d(input, self.pad, self.unpad, self.backend, self.J,
                 self.L, self.phi, self.psi, self.max_order, self.out_type)
 
@@ -188,6 +188,156 @@ def test_scattering_GPU_CPU(backend, random_state=42):
         assert torch.allclose(s_cpu, s_gpu, atol=1e-7)
 
 
+@pytest.mark.parametrize("backend", backends)
+def test_filters_follow_module(backend, random_state=42):
+    """
+    Checks that the filters used by the scattering are updated when the
+    module is moved (here, cast to another dtype) after the first call
+    """
+    if backend.name.endswith('_skcuda'):
+        pytest.skip("The skcuda backend does not support CPU tensors.")
+
+    torch.manual_seed(random_state)
+
+    J = 6
+    Q = 8
+    T = 2**10
+
+    scattering = Scattering1D(J, T, Q, backend=backend, frontend='torch')
+
+    x = torch.randn(2, T)
+    s = scattering(x)
+
+    scattering = scattering.double()
+    s_double = scattering(x.double())
+
+    assert scattering.phi_f[0].dtype == torch.float64
+    assert all(psi_f[0].dtype == torch.float64 for psi_f in scattering.psi1_f)
+    assert torch.allclose(s.double(), s_double, atol=1e-6)
+
+
+@pytest.mark.parametrize("backend", backends)
+def test_filters_follow_buffers(backend, random_state=42):
+    """
+    Checks that the filters used by the scattering are updated when the
+    buffers are replaced without moving the module, that is, by loading a
+    state dictionary with `assign=True` or through `functional_call`
+    """
+    if backend.name.endswith('_skcuda'):
+        pytest.skip("The skcuda backend does not support CPU tensors.")
+    if not hasattr(torch, 'func'):
+        pytest.skip("torch.func requires PyTorch 2.0.")
+
+    torch.manual_seed(random_state)
+
+    J = 6
+    Q = 8
+    T = 2**10
+
+    scattering = Scattering1D(J, T, Q, backend=backend, frontend='torch')
+    reference = Scattering1D(J, T, Q, backend=backend, frontend='torch')
+
+    x = torch.randn(2, T)
+    s = scattering(x)
+
+    state_dict = {key: 2 * value
+                  for key, value in scattering.state_dict().items()}
+    reference.load_state_dict(state_dict)
+    s_reference = reference(x)
+    assert not torch.allclose(s, s_reference)
+
+    s_functional = torch.func.functional_call(scattering, state_dict, (x,))
+    assert torch.allclose(s_functional, s_reference)
+    assert torch.allclose(scattering(x), s)
+
+    scattering.load_state_dict(state_dict, assign=True)
+    assert torch.allclose(scattering(x), s_reference)
+
+
+@pytest.mark.parametrize("backend", backends)
+def test_load_legacy_state_dict(backend):
+    """
+    Checks that a state dictionary with one buffer `tensor{n}` per filter,
+    as saved before the filters were stacked by resolution, can be loaded
+    """
+    if backend.name.endswith('_skcuda'):
+        pytest.skip("The skcuda backend does not support CPU tensors.")
+
+    J = 6
+    Q = 8
+    T = 2**10
+
+    scattering = Scattering1D(J, T, Q, backend=backend, frontend='torch')
+
+    # same numbering as the former register_filters
+    state_dict = {}
+    n = 0
+    for filt in [scattering.phi_f] + scattering.psi1_f + scattering.psi2_f:
+        for k in filt.keys():
+            if type(k) != str:
+                state_dict['tensor' + str(n)] = 2 * filt[k].clone()
+                n += 1
+
+    scattering.load_state_dict(state_dict)
+
+    assert set(dict(scattering.named_buffers()).keys()) == \
+        set('filters_res' + str(k) for k in scattering.phi_f.keys()
+            if type(k) != str)
+
+    n = 0
+    for filt in [scattering.phi_f] + scattering.psi1_f + scattering.psi2_f:
+        for k in filt.keys():
+            if type(k) != str:
+                assert torch.equal(filt[k], state_dict['tensor' + str(n)])
+                n += 1
+
+
+@pytest.mark.parametrize("backend", backends)
+def test_low_precision_filters(backend, random_state=42):
+    """
+    Checks that filters stored in bfloat16 give a float32 transform close to
+    the one obtained with float32 filters
+    """
+    if backend.name.endswith('_skcuda'):
+        pytest.skip("The skcuda backend does not support CPU tensors.")
+
+    torch.manual_seed(random_state)
+
+    J = 6
+    Q = 8
+    T = 2**10
+
+    scattering = Scattering1D(J, T, Q, backend=backend, frontend='torch')
+
+    x = torch.randn(2, T)
+    s = scattering(x)
+
+    scattering = scattering.to(torch.bfloat16)
+    s_bf16 = scattering(x)
+
+    assert scattering.phi_f[0].dtype == torch.bfloat16
+    assert s_bf16.dtype == torch.float32
+    assert torch.allclose(s, s_bf16, rtol=1e-2, atol=1e-3)
+
+
+@pytest.mark.parametrize("backend", backends)
+def test_psi1_f_res(backend):
+    """
+    Checks that the stacked first-order filters match the individual ones
+    """
+    J = 6
+    Q = 8
+    T = 2**10
+
+    scattering = Scattering1D(J, T, Q, backend=backend, frontend='torch')
+
+    psi1_f = scattering.psi1_f_res()
+
+    assert psi1_f.shape[0] == len(scattering.psi1_f)
+    for n1, psi_f in enumerate(scattering.psi1_f):
+        assert torch.equal(psi1_f[n1], psi_f[0])
+
+
 @pytest.mark.parametrize("device", devices)
 @pytest.mark.parametrize("backend", backends)
 def test_coordinates(device, backend, random_state=42):
@@ -2,7 +2,8 @@ import numpy as np
 import pytest
 from kymatio import Scattering1D
 from kymatio.scattering1d.frontend.torch_frontend import ScatteringTorch1D
-from kymatio.scattering1d.utils import compute_border_indices, compute_padding
+from kymatio.scattering1d.utils import (compute_border_indices, compute_padding,
+                                       compute_minimum_support_to_pad)
 
 
 def test_compute_padding():
@@ -22,6 +23,20 @@ def test_compute_padding():
     assert "Too large padding value" in ve.value.args[0]
 
 
+def test_compute_minimum_support_to_pad():
+    """
+    Test the compute_minimum_support_to_pad function when J is large with
+    respect to T: only the low-pass filter is needed to compute the padding,
+    so these configurations are accepted and give a finite transform
+    """
+    assert compute_minimum_support_to_pad(16, 4, 4) == 24
+
+    for J, T, Q in [(4, 16, 4), (7, 100, 4)]:
+        scattering = Scattering1D(J, T, Q, frontend='numpy')
+        Sx = scattering(np.random.randn(T))
+        assert np.all(np.isfinite(Sx))
+
+
 def test_border_indices(random_state=42):
     """
     Tests whether the border indices to unpad are well computed
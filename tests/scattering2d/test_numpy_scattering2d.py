@@ -234,6 +234,19 @@ class TestScattering2DNumpy:
             assert Sx.shape[-3] == n_coeffs
             assert Sx.shape[:-3] == test_shape[:-2]
 
+    @pytest.mark.parametrize('backend', backends)
+    def test_dtype(self, backend):
+        S = Scattering2D(2, (16, 16), frontend='numpy', backend=backend)
+
+        x = np.random.randn(2, 16, 16)
+
+        Sx = S(x)
+        Sx_single = S(x.astype(np.float32))
+
+        assert Sx.dtype == np.float64
+        assert Sx_single.dtype == np.float64
+        assert np.allclose(Sx, Sx_single, atol=1e-6)
+
     @pytest.mark.parametrize('backend', backends)
     def test_scattering2d_errors(self, backend):
         S = Scattering2D(3, (32, 32), frontend='numpy', backend=backend)